@@ -1,10 +1,14 @@
 import datetime as dt
+import functools
+import itertools
 import json
 import logging
 import re
+import sys
 import unicodedata
+import warnings
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -14,6 +18,11 @@ from dateutil import parser as datetimeparser
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)-8s %(message)s",
@@ -21,56 +30,162 @@ logging.basicConfig(
 )
 
 
+_SIGNAL_HEADER = re.compile(r"^\[\d{4}-\d{2}-\d{2}, \d{2}:\d{2}\]")
+_SIGNAL_DATETIME_FMT = "%Y-%m-%d, %H:%M"
+_WHATSAPP_HEADER = re.compile(
+    r"^[‎]?\[?(\d{1,4})([./,-])\d{1,2}\2\d{2,4}(?:\s|,\s)(0?\d|1\d|2[0-4]):([0-5]?\d)"
+)
+# Header lines start with a bracket, a left-to-right mark, or a digit
+# (any Unicode digit, matching the regex's \d); checking this before
+# running the regex rejects most continuation lines cheaply.
+_WHATSAPP_HEADER_STARTS = frozenset("[‎")
+_INSTAGRAM_SYSTEM_MESSAGE = re.compile(
+    "|".join(
+        re.escape(flag)
+        for flag in (
+            "to your message",
+            "in the poll.",
+            "created a poll: ",
+            "liked a message",
+            "This poll is no longer available.",
+            "'s poll has multiple updates.",
+        )
+    )
+)
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_datetime(
+    datestr: str, dayfirst: bool = False, fuzzy: bool = False
+) -> dt.datetime:
+    """Memoized dateutil parse. Chat logs repeat the same minute-resolution
+    datestrings many times, so most lookups are cache hits."""
+    return datetimeparser.parse(datestr, dayfirst=dayfirst, fuzzy=fuzzy)
+
+
+def _nfkc(text: str) -> str:
+    """NFKC-normalize a header line, skipping the normalizer for pure-ASCII
+    input where NFKC is always a no-op."""
+    return text if text.isascii() else unicodedata.normalize("NFKC", text)
+
+
+def _load_json(file: Path) -> Any:
+    """Deserialize a JSON export, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(file.read_bytes())
+    with file.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _utc_from_timestamp(seconds: int) -> dt.datetime:
+    """Naive UTC datetime from an epoch timestamp; utcfromtimestamp is
+    deprecated since Python 3.12."""
+    return dt.datetime.fromtimestamp(seconds, dt.timezone.utc).replace(tzinfo=None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fix_mojibake(text: str) -> str:
+    """Undo the double encoding in Meta exports. Cached because the small set
+    of sender names repeats on every message."""
+    return text.encode("latin-1").decode("utf-8")
+
+
+def _bulk_parse_datetimes(
+    datestrs: List[str], dayfirst: bool = False, fmt: Optional[str] = None
+) -> Dict[str, dt.datetime]:
+    """Parse all unique datestrings of a chat log in one vectorized
+    pd.to_datetime call and return a lookup table. Datestrings that pandas
+    cannot handle (e.g. localized am/pm suffixes) fall back to dateutil."""
+    unique = list(dict.fromkeys(datestrs))
+    with warnings.catch_warnings():
+        # Formats pandas cannot infer are handled by the dateutil fallback.
+        warnings.simplefilter("ignore", UserWarning)
+        if fmt:
+            parsed = pd.to_datetime(unique, format=fmt, errors="coerce", cache=True)
+        else:
+            parsed = pd.to_datetime(
+                unique, dayfirst=dayfirst, errors="coerce", cache=True
+            )
+    lookup: Dict[str, dt.datetime] = {}
+    for datestr, time in zip(unique, parsed):
+        if time is pd.NaT:
+            lookup[datestr] = _parse_datetime(datestr, dayfirst=dayfirst, fuzzy=True)
+        else:
+            lookup[datestr] = time.to_pydatetime()
+    return lookup
+
+
 @dataclass(frozen=True)
 class ParsedMessage:
+    # Declared manually because dataclass(slots=True) needs Python >= 3.10.
+    __slots__ = ("timestamp", "author", "message")
+
     timestamp: dt.datetime
     author: str
     message: str
 
 
 class ParsedMessageCollection:
+    """Stores parsed messages as three parallel column lists so DataFrame
+    construction is a plain column handover instead of a row transpose."""
+
     def __init__(self) -> None:
-        self._parsed_messages: List[ParsedMessage] = []
+        self._timestamps: List[dt.datetime] = []
+        self._authors: List[str] = []
+        self._messages: List[str] = []
 
     def append(self, mess: ParsedMessage) -> None:
-        self._parsed_messages.append(mess)
+        self._timestamps.append(mess.timestamp)
+        self._authors.append(mess.author)
+        self._messages.append(mess.message)
 
     def get_df(self, as_pandas: bool = False) -> Union[pd.DataFrame, pl.DataFrame]:
-        messages_as_dict = [asdict(mess) for mess in self._parsed_messages]
-        df = pl.DataFrame(messages_as_dict)
+        df = pl.DataFrame(
+            {
+                "timestamp": self._timestamps,
+                "author": self._authors,
+                "message": self._messages,
+            }
+        )
+        # Chats rarely have more than a few dozen distinct authors, so a
+        # categorical column stores integer codes instead of one string per row.
+        df = df.with_columns(pl.col("author").cast(pl.Categorical))
         return df.to_pandas() if as_pandas else df
 
     def write_to_json(self, file: str) -> None:
-        def serialize_message(mess: ParsedMessage) -> Dict[str, Any]:
-            return {
-                "timestamp": mess.timestamp.isoformat(),
-                "author": mess.author,
-                "message": mess.message,
+        records = [
+            {
+                "timestamp": timestamp.isoformat(),
+                "author": author,
+                "message": message,
             }
-
-        with open(file, "w") as json_file:
-            json.dump(
-                [serialize_message(mess) for mess in self._parsed_messages],
-                json_file,
-                indent=4,
+            for timestamp, author, message in zip(
+                self._timestamps, self._authors, self._messages
             )
+        ]
+        if orjson is not None:
+            with open(file, "wb") as json_file:
+                json_file.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file, "w") as json_file:
+                json.dump(records, json_file, indent=4)
 
     def read_from_json(self, file: str) -> None:
-        def deserialize_message(mess: Dict[str, Any]) -> ParsedMessage:
-            timestamp = dt.datetime.fromisoformat(mess["timestamp"])
-            author = mess["author"]
-            message = mess["message"]
-            return ParsedMessage(timestamp=timestamp, author=author, message=message)
-
-        with open(file, "r") as json_file:
-            self._parsed_messages = [
-                deserialize_message(mess) for mess in json.load(json_file)
-            ]
+        records = _load_json(Path(file))
+        self._timestamps = [
+            dt.datetime.fromisoformat(mess["timestamp"]) for mess in records
+        ]
+        self._authors = [mess["author"] for mess in records]
+        self._messages = [mess["message"] for mess in records]
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ParsedMessageCollection):
             return NotImplemented
-        return self._parsed_messages == other._parsed_messages
+        return (
+            self._timestamps == other._timestamps
+            and self._authors == other._authors
+            and self._messages == other._messages
+        )
 
 
 class Parser(ABC):
@@ -82,13 +197,11 @@ class Parser(ABC):
         self.parsed_messages = ParsedMessageCollection()
 
         self._logger = logging.getLogger(__name__)
-        self._logger.info(
-            """
+        self._logger.info("""
             Depending on the platform, the message format in chat logs might not be
             standardized across devices/versions/localization and might change over
             time. Please report issues including your message format via GitHub.
-            """
-        )
+            """)
         self._logger.info("Initialized parser.")
 
     def parse_file(self) -> None:
@@ -104,8 +217,14 @@ class Parser(ABC):
     def _read_raw_messages_from_file(self) -> None: ...
 
     def _parse_raw_messages(self) -> None:
+        progress = tqdm(
+            self._raw_messages,
+            disable=not sys.stderr.isatty(),
+            mininterval=0.5,
+            miniters=len(self._raw_messages) // 200 or 1,
+        )
         with logging_redirect_tqdm():
-            for raw_mess in tqdm(self._raw_messages):
+            for raw_mess in progress:
                 parsed_mess = self._parse_message(raw_mess)
                 if parsed_mess:
                     self.parsed_messages.append(parsed_mess)
@@ -116,38 +235,33 @@ class Parser(ABC):
 
 class SignalParser(Parser):
     def _read_raw_messages_from_file(self) -> None:
-        def _is_new_message(line: str) -> bool:
-            regex = r"^\[\d{4}-\d{2}-\d{2}, \d{2}:\d{2}\]"
-            return re.match(regex, line) is not None
-
-        with self._file.open(encoding="utf-8") as f:
-            lines = reversed(list(f))
-
         self._raw_messages: List[str]
         buffer: List[str] = []
-        for line in lines:
-            if not line:
-                continue
 
-            if _is_new_message(line):
-                if buffer:
-                    buffer.append(line)
-                    buffer.reverse()
-                    joined_buffer = " ".join(buffer)
-                    self._raw_messages.append("".join(joined_buffer.splitlines()))
-                    buffer.clear()
-                else:
-                    self._raw_messages.append(line)
-            else:
+        def _flush_buffer() -> None:
+            if buffer:
+                self._raw_messages.append(" ".join(buffer))
+                buffer.clear()
+
+        for line in self._file.read_text(encoding="utf-8").splitlines():
+            if line[:1] == "[" and _SIGNAL_HEADER.match(line):
+                _flush_buffer()
                 buffer.append(line)
+            elif buffer:
+                buffer.append(line)
+        _flush_buffer()
+        self._raw_messages.reverse()
+
+        self._datetime_lookup = _bulk_parse_datetimes(
+            [mess.partition("]")[0][1:] for mess in self._raw_messages],
+            fmt=_SIGNAL_DATETIME_FMT,
+        )
 
     def _parse_message(self, mess: str) -> ParsedMessage:
-        datetime_raw, mess = mess.split("]", 1)
-        time = datetimeparser.parse(datetime_raw[1:])
-        author, body = mess.split(":", 1)
-        author = author.strip()
-        body = body.strip()
-        return ParsedMessage(time, author, body)
+        datetime_raw, _, mess = mess.partition("]")
+        time = self._datetime_lookup[datetime_raw[1:]]
+        author, _, body = mess.partition(":")
+        return ParsedMessage(time, author.strip(), body.strip())
 
 
 class WhatsAppParser(Parser):
@@ -156,56 +270,60 @@ class WhatsAppParser(Parser):
         self._datefmt = WhatsAppDateFormat(self._logger)
 
     def _read_raw_messages_from_file(self) -> None:
-        def _is_new_message(line: str) -> bool:
-            regex = r"^[\u200e]?\[?(\d{1,4})([./,-])\d{1,2}\2\d{2,4}(?:\s|,\s)(0?\d|1\d|2[0-4]):([0-5]?\d)"
-            return re.match(regex, line) is not None
-
-        with self._file.open(encoding="utf-8") as f:
-            lines = reversed(list(f))
-
         self._raw_messages: List[str]
         buffer: List[str] = []
-        for line in lines:
-            if not line:
-                continue
 
-            if _is_new_message(line):
+        def _flush_buffer() -> None:
+            if buffer:
+                self._raw_messages.append(" ".join(buffer))
+                buffer.clear()
+
+        for line in self._file.read_text(encoding="utf-8").splitlines():
+            if (
+                line[:1] in _WHATSAPP_HEADER_STARTS or line[:1].isdigit()
+            ) and _WHATSAPP_HEADER.match(line):
                 line = line.replace("\u200e", "")
-                line = unicodedata.normalize("NFKC", line.strip())
-                if buffer:
-                    buffer.append(line)
-                    buffer.reverse()
-                    joined_buffer = " ".join(buffer)
-                    self._raw_messages.append("".join(joined_buffer.splitlines()))
-                    buffer.clear()
-                else:
-                    self._raw_messages.append(line)
-            else:
+                line = _nfkc(line.strip())
+                _flush_buffer()
+                buffer.append(line)
+            elif buffer:
                 buffer.append(line)
+        _flush_buffer()
+        self._raw_messages.reverse()
 
         self._datefmt.infer_format(self._raw_messages)
-
-    def _parse_message(self, mess: str) -> Optional[ParsedMessage]:
-        datestr, author_and_body = mess.split(self._datefmt.date_author_sep, 1)
-        time = datetimeparser.parse(
-            datestr, dayfirst=self._datefmt.is_dayfirst, fuzzy=True
+        date_author_sep = self._datefmt.date_author_sep
+        assert date_author_sep is not None
+        self._date_author_sep: str = date_author_sep
+        datestrs = [mess.partition(date_author_sep)[0] for mess in self._raw_messages]
+        if self._datefmt.has_brackets:
+            datestrs = [datestr[1:] for datestr in datestrs]
+        self._datetime_lookup = _bulk_parse_datetimes(
+            datestrs,
+            dayfirst=bool(self._datefmt.is_dayfirst),
+            fmt=self._datefmt.strptime_fmt,
         )
 
-        if ": " in author_and_body:
-            author, body = [x.strip() for x in author_and_body.split(": ", 1)]
-            return ParsedMessage(time, author, body)
+    def _parse_message(self, mess: str) -> Optional[ParsedMessage]:
+        datestr, _, author_and_body = mess.partition(self._date_author_sep)
+        if self._datefmt.has_brackets:
+            datestr = datestr[1:]
+        time = self._datetime_lookup[datestr]
+
+        author, sep, body = author_and_body.partition(": ")
+        if sep:
+            return ParsedMessage(time, author.strip(), body.strip())
         elif ":." in author_and_body:
-            self._logger.info(f"Ignoring self-destroying message on {time}.")
+            self._logger.info("Ignoring self-destroying message on %s.", time)
         else:
             body = author_and_body.strip()
-            self._logger.info(f"Ignoring sytem message on {time}: {body}.")
+            self._logger.info("Ignoring system message on %s: %s.", time, body)
         return None
 
 
 class FacebookMessengerParser(Parser):
     def _read_raw_messages_from_file(self) -> None:
-        with self._file.open(encoding="utf-8") as f:
-            self._raw_messages: List[Dict[str, Any]] = json.load(f)["messages"]
+        self._raw_messages: List[Dict[str, Any]] = _load_json(self._file)["messages"]
 
     def _parse_message(self, mess: Dict[str, Any]) -> Optional[ParsedMessage]:
         if "content" not in mess:
@@ -213,37 +331,33 @@ class FacebookMessengerParser(Parser):
 
         body = mess["content"]
 
-        time = dt.datetime.utcfromtimestamp(mess["timestamp_ms"] / 1000)
-        author = mess["sender_name"].encode("latin-1").decode("utf-8")
+        seconds, millis = divmod(mess["timestamp_ms"], 1000)
+        time = _utc_from_timestamp(seconds)
+        if millis:
+            time = time.replace(microsecond=millis * 1000)
+        author = _fix_mojibake(mess["sender_name"])
         body = body.encode("latin-1").decode("utf-8")
         return ParsedMessage(time, author, body)
 
 
 class InstagramJsonParser(Parser):
     def _read_raw_messages_from_file(self) -> None:
-        with self._file.open(encoding="utf-8") as f:
-            self._raw_messages: List[Dict[str, Any]] = json.load(f)["messages"]
+        self._raw_messages: List[Dict[str, Any]] = _load_json(self._file)["messages"]
 
     def _parse_message(self, mess: Dict[str, Any]) -> Optional[ParsedMessage]:
         if "content" not in mess:
             return None
 
-        system_messages = [
-            "to your message",
-            "in the poll.",
-            "created a poll: ",
-            "liked a message",
-            "This poll is no longer available.",
-            "'s poll has multiple updates.",
-        ]
-
-        if any(flag in mess["content"] for flag in system_messages):
+        if _INSTAGRAM_SYSTEM_MESSAGE.search(mess["content"]):
             return None
 
         body = mess["content"]
 
-        time = dt.datetime.utcfromtimestamp(mess["timestamp_ms"] / 1000)
-        author = mess["sender_name"].encode("latin-1").decode("utf-8")
+        seconds, millis = divmod(mess["timestamp_ms"], 1000)
+        time = _utc_from_timestamp(seconds)
+        if millis:
+            time = time.replace(microsecond=millis * 1000)
+        author = _fix_mojibake(mess["sender_name"])
         body = body.encode("latin-1").decode("utf-8")
         return ParsedMessage(time, author, body)
 
@@ -254,8 +368,7 @@ class TelegramJsonParser(Parser):
         self.chat_name: Optional[str] = chat_name
 
     def _read_raw_messages_from_file(self) -> None:
-        with self._file.open(encoding="utf-8") as f:
-            json_objects = json.load(f)
+        json_objects = _load_json(self._file)
 
         if "messages" in json_objects:
             self._logger.info("Detected single chat export.")
@@ -274,15 +387,13 @@ class TelegramJsonParser(Parser):
         if "from" not in mess or "text" not in mess:
             return None
 
-        if isinstance(mess["text"], str):
-            body = mess["text"]
-        elif isinstance(mess["text"], list):
-            text_elements = [
-                m["text"] if isinstance(m, dict) else m for m in mess["text"]
-            ]
-            body = " ".join(text_elements)
+        text = mess["text"]
+        if isinstance(text, str):
+            body = text
+        elif isinstance(text, list):
+            body = " ".join(m["text"] if isinstance(m, dict) else m for m in text)
 
-        time = dt.datetime.utcfromtimestamp(int(mess["date_unixtime"]))
+        time = _utc_from_timestamp(int(mess["date_unixtime"]))
         author = mess["from"]
         return ParsedMessage(time, author, body)
 
@@ -294,6 +405,7 @@ class WhatsAppDateFormat:
         self.has_brackets: Optional[bool] = None
         self.date_sep: Optional[str] = None
         self.date_author_sep: Optional[str] = None
+        self.strptime_fmt: Optional[str] = None
         self._logger = logger
 
     def infer_format(self, raw_messages: List[str]) -> None:
@@ -302,6 +414,7 @@ class WhatsAppDateFormat:
         self.date_sep = self._infer_date_sep(raw_messages[0])
         self.is_yearfirst = self._infer_yearfirst(raw_messages[0])
         self.is_dayfirst = self._infer_dayfirst(raw_messages)
+        self.strptime_fmt = self._infer_strptime_fmt(raw_messages[0])
         self._log_resulting_format()
 
     @staticmethod
@@ -314,7 +427,7 @@ class WhatsAppDateFormat:
     def _infer_date_sep(self, mess: str) -> str:
         datestr = mess.split(self.date_author_sep, 1)[0]
         if self.has_brackets:
-            datestr = datestr.lstrip("[").rstrip("]")
+            datestr = datestr[1:]
         for c in datestr:
             if not c.isdigit():
                 return c
@@ -323,26 +436,28 @@ class WhatsAppDateFormat:
     def _infer_yearfirst(self, mess: str) -> bool:
         datestr = mess.split(self.date_author_sep, 1)[0]
         if self.has_brackets:
-            datestr = datestr.lstrip("[").rstrip("]")
+            datestr = datestr[1:]
         return int(datestr.split(self.date_sep)[0]) >= 100
 
     def _infer_dayfirst(self, raw_messages: List[str]) -> bool:
+        assert self.date_sep is not None
         max_first = 0
         max_second = 0
-        for mess in raw_messages:
-            datestr = mess.split(self.date_author_sep, 1)[0]
-
-            if self.has_brackets:
-                datestr = datestr.lstrip("[").rstrip("]")
-
-            if self.is_yearfirst:
-                datepart = datestr.split(",")[0]
-                day_and_month = [int(num) for num in datepart.split(self.date_sep)[1:3]]
-            else:
-                day_and_month = [int(num) for num in datestr.split(self.date_sep)[:2]]
+        sep = re.escape(self.date_sep)
+        if self.is_yearfirst:
+            dateparts = re.compile(rf"^\[?\d{{1,4}}{sep}(\d{{1,2}}){sep}(\d{{1,2}})")
+        else:
+            dateparts = re.compile(rf"^\[?(\d{{1,4}}){sep}(\d{{1,2}})")
+        # A sample of at most ~5000 messages spans enough days of the month
+        # to disambiguate; scanning every message of a huge log is wasted.
+        step = max(1, len(raw_messages) // 5000)
+        for mess in itertools.islice(raw_messages, 0, None, step):
+            match = dateparts.match(mess)
+            if not match:
+                continue
 
-            max_first = max(max_first, day_and_month[0])
-            max_second = max(max_second, day_and_month[1])
+            max_first = max(max_first, int(match.group(1)))
+            max_second = max(max_second, int(match.group(2)))
 
             if max_first > 12 or max_second > 12:
                 break
@@ -356,6 +471,36 @@ class WhatsAppDateFormat:
         )
         return True
 
+    def _infer_strptime_fmt(self, mess: str) -> Optional[str]:
+        """Compose candidate strptime formats from the inferred components and
+        return the first one matching the datestring of the given message.
+        None means no candidate fits (e.g. localized am/pm suffixes) and
+        parsing stays on the generic path."""
+        if self.is_yearfirst:
+            date_fmts = [f"%Y{self.date_sep}%m{self.date_sep}%d"]
+        else:
+            first, second = ("%d", "%m") if self.is_dayfirst else ("%m", "%d")
+            date_fmts = [
+                f"{first}{self.date_sep}{second}{self.date_sep}{year}"
+                for year in ("%y", "%Y")
+            ]
+        datestr = mess.split(self.date_author_sep, 1)[0]
+        if self.has_brackets:
+            datestr = datestr[1:]
+        candidates = [
+            f"{date_fmt}{date_time_sep}{time_fmt}"
+            for date_fmt in date_fmts
+            for date_time_sep in (", ", " ")
+            for time_fmt in ("%H:%M:%S", "%H:%M")
+        ]
+        for fmt in candidates:
+            try:
+                dt.datetime.strptime(datestr, fmt)
+            except ValueError:
+                continue
+            return fmt
+        return None
+
     def _log_resulting_format(self) -> None:
         start = "[" if self.has_brackets else ""
         end = "]" if self.has_brackets else ""
@@ -11,6 +11,14 @@ from chatminer.chatparsers import (
     WhatsAppParser,
 )
 
+PARSERS = {
+    "whatsapp": WhatsAppParser,
+    "facebook": FacebookMessengerParser,
+    "instagram": InstagramJsonParser,
+    "signal": SignalParser,
+    "telegram": TelegramJsonParser,
+}
+
 
 def get_args():
     try:
@@ -24,7 +32,7 @@ def get_args():
             "--parser",
             type=str,
             help="The platform from which the chats are imported",
-            choices=["whatsapp", "instagram", "facebook", "signal", "telegram"],
+            choices=sorted(PARSERS),
         )
 
         cliparser.add_argument(
@@ -47,23 +55,17 @@ def main():
         if args.input is None or args.output is None or args.parser is None:
             raise ValueError
 
-        if (args.parser).lower() == "whatsapp":
-            chatparser = WhatsAppParser(args.input)
-
-        elif (args.parser).lower() == "facebook":
-            chatparser = FacebookMessengerParser(args.input)
-        elif (args.parser).lower() == "instagram":
-            chatparser = InstagramJsonParser(args.input)
-        elif (args.parser).lower() == "signal":
-            chatparser = SignalParser(args.input)
-        elif (args.parser).lower() == "telegram":
-            chatparser = TelegramJsonParser(args.input)
-        else:
+        parser_cls = PARSERS.get(args.parser.lower())
+        if parser_cls is None:
             raise ValueError
+        chatparser = parser_cls(args.input)
 
         chatparser.parse_file()
         df = chatparser.parsed_messages.get_df()
-        df.to_csv(args.output, index=False)
+        if args.output.endswith(".parquet"):
+            df.write_parquet(args.output)
+        else:
+            df.write_csv(args.output)
 
     except ValueError:
         cliparser.print_usage()
@@ -1,8 +1,13 @@
-from typing import Optional
+from typing import List, Optional
 
 import polars as pl
 from transformers import pipeline
 
+try:
+    import torch
+except ImportError:
+    torch = None
+
 
 def add_sentiment(df: pl.DataFrame, lang: str = "en") -> pl.DataFrame:
     """
@@ -24,26 +29,48 @@ def add_sentiment(df: pl.DataFrame, lang: str = "en") -> pl.DataFrame:
         if lang == "en"
         else "cardiffnlp/twitter-xlm-roberta-base-sentiment"
     )
-    sentiment_pipeline = pipeline("sentiment-analysis", model=model_path)
+    use_gpu = torch is not None and torch.cuda.is_available()
+    sentiment_pipeline = pipeline(
+        "sentiment-analysis",
+        model=model_path,
+        device=0 if use_gpu else -1,
+        torch_dtype=torch.float16 if use_gpu else None,
+        batch_size=64,
+        truncation=True,
+    )
 
-    def extract_sentiment(message: str) -> Optional[str]:
+    def extract_sentiments(messages: List[str]) -> List[Optional[str]]:
         """
-        Extract sentiment from message
+        Extract sentiments for a batch of messages
 
         Parameters:
-        message (str): The input message
+        messages (List[str]): The input messages
 
         Returns:
-        str: The sentiment of the message
+        List[Optional[str]]: The sentiment of each message
 
         """
         try:
-            return sentiment_pipeline(message)[0]["label"]
-        except Exception as e:
-            print(f"Error processing message: {message}: {e}")
-            return None
+            return [res["label"] for res in sentiment_pipeline(messages)]
+        except Exception:
+            # A single malformed message fails the whole batch, so retry
+            # one by one to keep the remaining results.
+            sentiments = []
+            for message in messages:
+                try:
+                    sentiments.append(sentiment_pipeline(message)[0]["label"])
+                except Exception as e:
+                    print(f"Error processing message: {message}: {e}")
+                    sentiments.append(None)
+            return sentiments
 
+    # Chats repeat many messages verbatim ("ok", emoji-only, stickers), so
+    # only run the model once per distinct message and map the labels back.
+    unique_messages = df["message"].unique(maintain_order=True).to_list()
+    sentiments = extract_sentiments(unique_messages)
     df = df.with_columns(
-        (pl.col("message")).map_elements(extract_sentiment).alias("sentiment"),
+        pl.col("message")
+        .replace_strict(unique_messages, sentiments, return_dtype=pl.String)
+        .alias("sentiment"),
     )
     return df
@@ -1,12 +1,13 @@
 import calendar
 import datetime
+import functools
 
 import matplotlib.pyplot as plt
 import numpy as np
 import polars as pl
-from dateutil.relativedelta import relativedelta
+from matplotlib.collections import PolyCollection
 from matplotlib.colors import ColorConverter
-from matplotlib.patches import Circle, Polygon, RegularPolygon
+from matplotlib.patches import Circle, RegularPolygon
 from matplotlib.path import Path
 from matplotlib.projections import register_projection
 from matplotlib.projections.polar import PolarAxes
@@ -15,6 +16,59 @@ from matplotlib.transforms import Affine2D
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 from wordcloud import STOPWORDS, WordCloud
 
+_SUNBURST_BAR_WIDTH = 2 * np.pi / 24
+_SUNBURST_RAD = np.arange(24) * _SUNBURST_BAR_WIDTH + np.pi / 24
+_SUNBURST_XTICKS = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+_SUNBURST_XTICKLABELS = [f"{hour}:00" for hour in range(0, 24, 3)]
+
+
+@functools.lru_cache(maxsize=64)
+def _rgba_alpha(color):
+    return ColorConverter().to_rgba(color)[-1]
+
+
+@functools.lru_cache(maxsize=32)
+def _month_layout(year):
+    """Compute the heatmap x-ticks, month labels and month border outlines
+    with plain day-of-year arithmetic instead of datetime/strftime calls.
+
+    The layout depends only on the year, so repeated heatmaps (e.g. one per
+    author) reuse the cached geometry."""
+    start = datetime.date(year, 1, 1).weekday()
+    xticks, labels, polys = [], [], []
+    day_of_year = 1
+    for month in range(1, 13):
+        first = day_of_year
+        last = day_of_year + calendar.monthrange(year, month)[1] - 1
+        day_of_year = last + 1
+        y0 = 6 - (start + first - 1) % 7
+        y1 = 6 - (start + last - 1) % 7
+        x0 = (first + start - 1) // 7
+        x1 = (last + start - 1) // 7
+        polys.append(
+            [
+                (x0, y0 + 1),
+                (x0, 0),
+                (x1, 0),
+                (x1, y1),
+                (x1 + 1, y1),
+                (x1 + 1, 7),
+                (x0 + 1, 7),
+                (x0 + 1, y0 + 1),
+            ]
+        )
+        xticks.append(x0 + (x1 - x0 + 1) / 2)
+        labels.append(calendar.month_abbr[month])
+    return xticks, labels, polys
+
+
+def _to_polars(df, cols) -> pl.DataFrame:
+    """Return a polars frame holding only the columns the plot reads, so a
+    pandas input converts just those columns instead of the whole frame."""
+    if isinstance(df, pl.DataFrame):
+        return df.select(cols)
+    return pl.from_pandas(df[cols], rechunk=False)
+
 
 def sunburst(
     df,
@@ -27,29 +81,26 @@ def sunburst(
     ax=None,
     authors=None,
 ) -> PolarAxes:
-    if not isinstance(df, pl.DataFrame):
-        df = pl.from_pandas(df)
+    df = _to_polars(df, ["timestamp", "author"] if authors else ["timestamp"])
 
+    lf = df.lazy()
     if authors:
-        df = df.filter(pl.col("author").is_in(authors))
+        lf = lf.filter(pl.col("author").is_in(authors))
 
-    df = df.with_columns(hour=pl.col("timestamp").dt.hour())
-    df_circle = (
-        df.group_by("hour")
-        .agg(pl.col("message").count().alias("message_count"))
-        .sort("hour")
-    )
-    df_circle = df_circle.with_columns(rad=pl.col("hour") * 2 / 24 * np.pi + np.pi / 24)
+    # 24 bins are too few to justify a groupby; a single bincount over the
+    # hour array yields the histogram with every hour present.
+    hours = lf.select(pl.col("timestamp").dt.hour()).collect().to_series().to_numpy()
+    message_counts = np.bincount(hours, minlength=24)
+    max_count = message_counts.max()
 
     if ax is None:
         _, ax = plt.subplots(subplot_kw={"projection": "polar"})
 
-    alpha = 0.6 if highlight_max else 1
-    ax.bar(
-        df_circle["rad"],
-        df_circle["message_count"],
-        width=2 * np.pi / 24,
-        alpha=alpha,
+    bars = ax.bar(
+        _SUNBURST_RAD,
+        message_counts,
+        width=_SUNBURST_BAR_WIDTH,
+        alpha=0.6 if highlight_max else 1,
         color=color,
         bottom=0,
         edgecolor=edgecolor,
@@ -57,47 +108,31 @@ def sunburst(
     )
 
     if highlight_max:
-        df_circle_max = df_circle.filter(
-            df_circle["message_count"] == df_circle["message_count"].max()
-        )
-        ax.bar(
-            df_circle_max["rad"],
-            df_circle_max["message_count"],
-            bottom=0,
-            width=2 * np.pi / 24,
-            alpha=1,
-            color=color,
-            edgecolor=edgecolor,
-            linewidth=linewidth,
-        )
+        for index in np.flatnonzero(message_counts == max_count):
+            bars.patches[index].set_alpha(1)
 
-    ax.bar(
-        df_circle["rad"],
-        df_circle["message_count"].max() * np.ones(24),
-        width=2 * np.pi / 24,
-        alpha=0.1,
-        bottom=0,
-        color=color,
+    # Background disk up to the max count as a single filled polygon instead
+    # of 24 full-height translucent bars.
+    ax.fill_between(
+        np.linspace(0, 2 * np.pi, 100), 0, max_count, alpha=0.1, color=color
     )
 
     ax.set_theta_direction(-1)
     ax.spines["polar"].set_visible(True)
-    ax.set_rmax(df_circle["message_count"].max())
+    ax.set_rmax(max_count)
     ax.grid(True)
     ax.set_axisbelow(True)
 
     ax.set_theta_offset(np.pi / 2)
-    ax.set_xticks(np.linspace(0, 2 * np.pi, 8, endpoint=False))
-    ticks = [f"{x}:00" for x in range(0, 24, 3)]
-    ax.set_xticklabels(ticks)
+    ax.set_xticks(_SUNBURST_XTICKS)
+    ax.set_xticklabels(_SUNBURST_XTICKLABELS)
 
     if isolines:
         if isolines_relative:
-            ax.set_yticks(np.asarray(isolines) * df_circle["message_count"].max())
+            ax.set_yticks(np.asarray(isolines) * max_count)
         else:
             ax.set_yticks(isolines)
 
-    plt.tight_layout()
     return ax
 
 
@@ -108,31 +143,53 @@ def wordcloud(
     authors=None,
     **kwargs,
 ) -> plt.Axes:
-    if not isinstance(df, pl.DataFrame):
-        df = pl.from_pandas(df)
+    df = _to_polars(df, ["message", "author"] if authors else ["message"])
 
     if authors:
         df = df.filter(pl.col("author").is_in(authors))
 
-    messages = [mess.split() for mess in df["message"]]
-    words = [word.lower() for sublist in messages for word in sublist]
+    # Build a per-call set; updating the package-global STOPWORDS would make
+    # custom stopwords leak into every later wordcloud in the process.
+    stopwords = frozenset(STOPWORDS) | frozenset(stopwords or ())
+
+    # Tokenize like WordCloud.process_text (split on \w[\w']*, strip a
+    # trailing 's, drop pure-digit tokens and stopwords, merge plurals),
+    # but count inside polars so neither a giant concatenated string nor a
+    # second Python-level tokenization pass is needed.
+    freqs = (
+        df.lazy()
+        .select(word=pl.col("message").str.to_lowercase().str.extract_all(r"\w[\w']*"))
+        .explode("word")
+        .drop_nulls()
+        .with_columns(pl.col("word").str.replace(r"'s$", ""))
+        .filter(~pl.col("word").str.contains(r"^\d+$"))
+        .filter(~pl.col("word").is_in([word.lower() for word in stopwords]))
+        .group_by("word")
+        .agg(pl.len().alias("count"))
+        .collect()
+    )
 
-    if stopwords:
-        STOPWORDS.update(stopwords)
-    stopwords = STOPWORDS
+    counts = dict(zip(freqs["word"], freqs["count"]))
+    # Merge plurals into the singular count like WordCloud's
+    # normalize_plurals: fold <word>s into <word> when both occur, except
+    # for words ending in "ss". The dict holds unique words only, so this
+    # pass is cheap.
+    for word in [w for w in counts if w.endswith("s") and not w.endswith("ss")]:
+        singular = word[:-1]
+        if singular in counts:
+            counts[singular] += counts.pop(word)
 
     wc = WordCloud(
         stopwords=stopwords,
         **kwargs,
     )
-    wc.generate(" ".join(words))
+    wc.generate_from_frequencies(counts)
 
     if ax is None:
         _, ax = plt.subplots()
 
     ax.imshow(wc, interpolation="bilinear")
-    plt.axis("off")
-    plt.tight_layout()
+    ax.set_axis_off()
     return ax
 
 
@@ -155,60 +212,56 @@ def calendar_heatmap(
     Adapted from https://github.com/MarvinT/calmap.
     Copyright (c) 2015 by Martijn Vermaat and contributors
     """
-    if not isinstance(df, pl.DataFrame):
-        df = pl.from_pandas(df)
+    df = _to_polars(df, ["timestamp", "author"] if authors else ["timestamp"])
 
+    lf = df.lazy()
     if authors:
-        df = df.filter(pl.col("author").is_in(authors))
+        lf = lf.filter(pl.col("author").is_in(authors))
 
-    if year not in df["timestamp"].dt.year():
-        available_years = df["timestamp"].dt.year().unique()
-        raise ValueError(
-            f"No message in year {year}. Available years: {available_years}"
-        )
-
-    df = df.filter(pl.col("timestamp").dt.year() == year)
-
-    df = df.with_columns(date=pl.col("timestamp").dt.date())
     df_day = (
-        df.group_by("date")
-        .agg(pl.col("message").count().alias("message_count"))
-        .sort("date")
+        lf.filter(pl.col("timestamp").dt.year() == year)
+        .group_by(pl.col("timestamp").dt.date().alias("date"))
+        .agg(pl.len().alias("message_count"))
+        .collect()
     )
 
-    df_calendar = pl.date_range(
-        datetime.date(year, 1, 1), datetime.date(year, 12, 31), "1d", eager=True
-    )
-
-    df_joined = (
-        df_calendar.to_frame(name="date")
-        .join(df_day, on="date", how="left")
-        .fill_null(strategy="zero")
-    )
+    if df_day.is_empty():
+        available_years = (
+            lf.select(pl.col("timestamp").dt.year().unique()).collect().to_series()
+        )
+        raise ValueError(
+            f"No message in year {year}. Available years: {available_years}"
+        )
 
-    df_joined = df_joined.with_columns(
-        weekday=pl.col("date").dt.weekday(), week=pl.col("date").dt.week()
+    # Scatter the daily counts straight into a (weekday, week) grid instead of
+    # joining against a full-year date range and pivoting. Row 0 is Sunday at
+    # the bottom of the plot, matching the y-tick placement below.
+    jan1 = datetime.date(year, 1, 1)
+    start = jan1.weekday()
+    num_days = (datetime.date(year, 12, 31) - jan1).days + 1
+    counts = np.zeros(num_days, dtype=np.int64)
+    day_of_year = (
+        (df_day["date"].to_numpy() - np.datetime64(jan1))
+        .astype("timedelta64[D]")
+        .astype(int)
     )
+    counts[day_of_year] = df_day["message_count"].to_numpy()
 
-    plot_data = df_joined.pivot(
-        index="weekday",
-        on="week",
-        values="message_count",
-        aggregate_function="sum",
-        maintain_order=True,
-    ).sort("weekday", descending=True)
+    offsets = np.arange(num_days) + start
+    plot_data = np.zeros((7, (num_days + start + 6) // 7), dtype=np.int64)
+    plot_data[6 - offsets % 7, offsets // 7] = counts
 
     if vmin is None:
-        vmin = df_joined["message_count"].min()
+        vmin = counts.min()
     if vmax is None:
-        vmax = df_joined["message_count"].max()
+        vmax = counts.max()
 
     if ax is None:
         ax = plt.gca()
 
     if linecolor is None:
         linecolor = ax.get_facecolor()
-        if ColorConverter().to_rgba(linecolor)[-1] == 0:
+        if _rgba_alpha(linecolor) == 0:
             linecolor = "white"
 
     kwargs["linewidth"] = linewidth
@@ -223,8 +276,8 @@ def calendar_heatmap(
 
     ax.set_aspect("equal")
 
-    for side in ("top", "right", "left", "bottom"):
-        ax.spines[side].set_visible(False)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
     ax.xaxis.set_tick_params(which="both", length=0)
     ax.yaxis.set_tick_params(which="both", length=0)
     if dayticks is True:
@@ -236,38 +289,20 @@ def calendar_heatmap(
 
     ax.set_xlabel("")
 
-    xticks, labels = [], []
-    for month in range(1, 13):
-        first = datetime.datetime(year, month, 1)
-        last = first + relativedelta(months=1, days=-1)
-        y0 = 6 - first.weekday()
-        y1 = 6 - last.weekday()
-        start = datetime.datetime(year, 1, 1).weekday()
-        x0 = (int(first.strftime("%j")) + start - 1) // 7
-        x1 = (int(last.strftime("%j")) + start - 1) // 7
-        P = [
-            (x0, y0 + 1),
-            (x0, 0),
-            (x1, 0),
-            (x1, y1),
-            (x1 + 1, y1),
-            (x1 + 1, 7),
-            (x0 + 1, 7),
-            (x0 + 1, y0 + 1),
-        ]
+    xticks, labels, polys = _month_layout(year)
 
-        xticks.append(x0 + (x1 - x0 + 1) / 2)
-        labels.append(first.strftime("%b"))
-        if monthly_border:
-            poly = Polygon(
-                P,
-                edgecolor="black",
-                facecolor="None",
-                linewidth=1,
+    if monthly_border:
+        ax.add_collection(
+            PolyCollection(
+                polys,
+                edgecolors="black",
+                facecolors="none",
+                linewidths=1,
                 zorder=20,
                 clip_on=False,
+                closed=True,
             )
-            ax.add_artist(poly)
+        )
 
     ax.set_xticks(xticks)
     ax.set_xticklabels(labels)
@@ -277,7 +312,6 @@ def calendar_heatmap(
     ax.set_yticklabels(
         [daylabels[i] for i in dayticks], rotation="horizontal", va="center"
     )
-    plt.tight_layout()
     return ax
 
 
@@ -288,25 +322,24 @@ def radar(
     ax=None,
     authors=None,
 ) -> plt.Axes:
-    if not isinstance(df, pl.DataFrame):
-        df = pl.from_pandas(df)
+    df = _to_polars(df, ["timestamp", "author"] if authors else ["timestamp"])
 
+    lf = df.lazy()
     if authors:
-        df = df.filter(pl.col("author").is_in(authors))
+        lf = lf.filter(pl.col("author").is_in(authors))
 
-    df = df.with_columns(weekday=pl.col("timestamp").dt.weekday())
-    df_radar = (
-        df.group_by("weekday")
-        .agg(pl.col("message").count().alias("message_count"))
-        .sort("weekday")
+    # Weekdays are 1 (Monday) through 7, so shift them onto the 7 bins.
+    weekdays = (
+        lf.select(pl.col("timestamp").dt.weekday()).collect().to_series().to_numpy()
     )
+    message_counts = np.bincount(weekdays - 1, minlength=7)
 
     if ax is None:
         _, ax = plt.subplots(subplot_kw={"projection": "radar"})
 
     theta = radar_factory(7, frame="polygon")
-    ax.plot(theta, df_radar["message_count"], color=color)
-    ax.fill(theta, df_radar["message_count"], facecolor=color, alpha=alpha)
+    ax.plot(theta, message_counts, color=color)
+    ax.fill(theta, message_counts, facecolor=color, alpha=alpha)
     ax.set_varlabels(
         [
             "MON",
@@ -321,9 +354,13 @@ def radar(
     return ax
 
 
+@functools.lru_cache(maxsize=8)
 def radar_factory(num_vars, frame="circle"):
     """
     Source: https://matplotlib.org/stable/gallery/specialty_plots/radar_chart.html
+
+    Cached so repeated radar() calls reuse the registered projection instead
+    of rebuilding the axes classes and mutating matplotlib's registry again.
     """
     # calculate evenly-spaced axis angles
     theta = np.linspace(0, 2 * np.pi, num_vars, endpoint=False)
@@ -361,9 +398,7 @@ def radar_factory(num_vars, frame="circle"):
             x, y = line.get_data()
             # FIXME: markers at x[0], y[0] get doubled-up
             if x[0] != x[-1]:
-                x = np.append(x, x[0])
-                y = np.append(y, y[0])
-                line.set_data(x, y)
+                line.set_data(np.concatenate([x, x[:1]]), np.concatenate([y, y[:1]]))
 
         def set_varlabels(self, labels):
             self.set_thetagrids(np.degrees(theta), labels)